@@ -1,10 +1,146 @@
 #!/usr/bin/env python
 # coding: utf-8
 
-from pymongo import MongoClient
+from pymongo import MongoClient, InsertOne
+from pymongo.errors import BulkWriteError
+from pymongo.write_concern import WriteConcern
 from bson.objectid import ObjectId
+from bson.binary import STANDARD
+from bson.codec_options import CodecOptions
+from bson.raw_bson import RawBSONDocument
+from cachetools import TTLCache
+from concurrent.futures import Future
+from urllib.parse import quote_plus
+import asyncio
+import atexit
+import functools
+import inspect
 import os
 import logging
+import queue
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# Codec options shared by every collection handle; _RAW_CODEC skips decoding
+# documents into dicts for callers that pass the BSON bytes straight through
+_CODEC = CodecOptions(document_class=dict, tz_aware=False, uuid_representation=STANDARD)
+_RAW_CODEC = CodecOptions(document_class=RawBSONDocument, tz_aware=False,
+                          uuid_representation=STANDARD)
+
+# Process-wide MongoClient cache so every CRUD instance sharing the same
+# server, credentials and pool settings reuses one connection pool.
+# _CLIENT_REFS counts the instances using each cached client
+_CLIENT_CACHE = {}
+_CLIENT_REFS = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+# (client key, database, collection) tuples whose rescue index has been
+# ensured in this process, also guarded by _CLIENT_CACHE_LOCK
+_ENSURED_INDEXES = set()
+
+
+@functools.lru_cache(maxsize=8)
+def _build_uri(host, port, username, password, auth_source):
+    """Build the MongoDB connection string; all URI options are set here"""
+    options = "retryWrites=true&w=majority&appname=aac-dashboard"
+    # Build connection string based on authentication requirements
+    if username and password:
+        return (f'mongodb://{quote_plus(username)}:{quote_plus(password)}@{host}:{port}/'
+                f'?authSource={auth_source}&{options}')
+    return f'mongodb://{host}:{port}/?{options}'
+
+
+def _get_client(key, connection_string, **client_options):
+    """
+    Return the cached MongoClient for key, creating it on first use
+    
+    Returns:
+        tuple: (MongoClient, bool) where the bool is True if the client was just created
+    """
+    with _CLIENT_CACHE_LOCK:
+        client = _CLIENT_CACHE.get(key)
+        if client is not None:
+            _CLIENT_REFS[key] += 1
+            return client, False
+        client = MongoClient(connection_string, **client_options)
+        _CLIENT_CACHE[key] = client
+        _CLIENT_REFS[key] = 1
+        return client, True
+
+
+def _release_client(key, client):
+    """
+    Drop one reference to a cached client, closing it when no instance uses it
+    
+    Returns:
+        bool: True if the client was closed
+    """
+    with _CLIENT_CACHE_LOCK:
+        if _CLIENT_CACHE.get(key) is not client:
+            return False
+        _CLIENT_REFS[key] -= 1
+        if _CLIENT_REFS[key] > 0:
+            return False
+        del _CLIENT_CACHE[key]
+        del _CLIENT_REFS[key]
+    client.close()
+    return True
+
+
+@atexit.register
+def _close_cached_clients():
+    """Close pooled sockets on orderly shutdown even if close_connection() is never called"""
+    with _CLIENT_CACHE_LOCK:
+        clients = list(_CLIENT_CACHE.values())
+        _CLIENT_CACHE.clear()
+        _CLIENT_REFS.clear()
+    for client in clients:
+        client.close()
+
+
+def _empty_dataframe():
+    """Return an empty DataFrame (pandas is only needed by read_df callers)"""
+    import pandas as pd
+    return pd.DataFrame()
+
+
+def _validate_query(default_factory, allow_none=False):
+    """
+    Decorator that checks the query argument of a CRUD method
+    
+    A None query becomes {} when allow_none is True. Any other non-dict query
+    is rejected and the method returns default_factory() instead of running.
+    """
+    def decorator(f):
+        def check(self, query):
+            if query is None and allow_none:
+                return {}
+            if type(query) is dict or isinstance(query, dict):
+                return query
+            self.logger.warning("Invalid query provided for %s operation", f.__name__)
+            return None
+        
+        if inspect.iscoroutinefunction(f):
+            @functools.wraps(f)
+            async def async_wrapper(self, query=None, *args, **kwargs):
+                query = check(self, query)
+                if query is None:
+                    return default_factory()
+                return await f(self, query, *args, **kwargs)
+            return async_wrapper
+        
+        @functools.wraps(f)
+        def wrapper(self, query=None, *args, **kwargs):
+            query = check(self, query)
+            if query is None:
+                return default_factory()
+            return f(self, query, *args, **kwargs)
+        return wrapper
+    return decorator
+
 
 class MongoDBCRUD(object):
     """ 
@@ -13,7 +149,8 @@ class MongoDBCRUD(object):
     """
     
     def __init__(self, username=None, password=None, host=None, port=None, 
-                 database_name=None, collection_name=None, auth_source="admin"):
+                 database_name=None, collection_name=None, auth_source="admin",
+                 max_pool_size=None, min_pool_size=None, wait_queue_timeout_ms=None):
         """
         Initialize the MongoDB CRUD client with flexible parameters
         
@@ -25,10 +162,13 @@ class MongoDBCRUD(object):
             database_name (str): Name of the database to connect to
             collection_name (str): Name of the collection to operate on
             auth_source (str): Authentication database (default: "admin")
+            max_pool_size (int): Maximum pooled sockets per server (default: 50)
+            min_pool_size (int): Sockets kept open in the pool (default: 5)
+            wait_queue_timeout_ms (int): Max wait for a free socket in ms (default: 2000)
         """
         
         # Set up logging
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
         
         # Store connection parameters
         self.username = username or os.getenv('MONGO_USERNAME')
@@ -39,37 +179,80 @@ class MongoDBCRUD(object):
         self.collection_name = collection_name or os.getenv('MONGO_COLLECTION')
         self.auth_source = auth_source
         
+        # Store connection pool parameters
+        # Checked against None so 0 (e.g. maxPoolSize=0 for unlimited) can be passed
+        if max_pool_size is None:
+            max_pool_size = int(os.getenv('MONGO_MAX_POOL_SIZE', 50))
+        if min_pool_size is None:
+            min_pool_size = int(os.getenv('MONGO_MIN_POOL_SIZE', 5))
+        if wait_queue_timeout_ms is None:
+            wait_queue_timeout_ms = int(os.getenv('MONGO_WAIT_QUEUE_TIMEOUT_MS', 2000))
+        self.max_pool_size = max_pool_size
+        self.min_pool_size = min_pool_size
+        self.wait_queue_timeout_ms = wait_queue_timeout_ms
+        
         # Validate required parameters
         if not self.database_name:
             raise ValueError("Database name is required")
         if not self.collection_name:
             raise ValueError("Collection name is required")
         
+        # Motor clients are bound to the event loop that first uses them, so
+        # one is created lazily per running loop: loop -> AsyncIOMotorClient
+        self._async_clients = {}
+        self._async_clients_lock = threading.Lock()
+        
+        # Background writer for create_batched(), started on first use
+        self._write_q = queue.Queue()
+        self._writer_thread = None
+        self._writer_lock = threading.Lock()
+        
+        # get_collection_info() results: (database, collection) -> (timestamp, info)
+        self._stats_cache = {}
+        
         # Initialize connections
         self._connect()
     
     def _connect(self):
         """Establish connection to MongoDB"""
+        self.client = None
         try:
-            # Build connection string based on authentication requirements
-            if self.username and self.password:
-                connection_string = f'mongodb://{self.username}:{self.password}@{self.host}:{self.port}/?authSource={self.auth_source}'
-            else:
-                connection_string = f'mongodb://{self.host}:{self.port}'
+            connection_string = _build_uri(self.host, self.port, self.username,
+                                           self.password, self.auth_source)
+            self._connection_string = connection_string
             
-            self.client = MongoClient(connection_string)
+            self._client_key = (self.host, self.port, self.username, self.password,
+                                self.auth_source, self.max_pool_size, self.min_pool_size,
+                                self.wait_queue_timeout_ms)
+            self.client, created = _get_client(self._client_key, connection_string,
+                                               maxPoolSize=self.max_pool_size,
+                                               minPoolSize=self.min_pool_size,
+                                               waitQueueTimeoutMS=self.wait_queue_timeout_ms,
+                                               serverSelectionTimeoutMS=3000,
+                                               connectTimeoutMS=2000)
             self.database = self.client[self.database_name]
-            self.collection = self.database[self.collection_name]
+            self._set_collection(self.collection_name)
             
-            # Test the connection
-            self.database.command('ping')
-            self.logger.info(f"Successfully connected to MongoDB: {self.database_name}.{self.collection_name}")
-            print(f"Connection to MongoDB successful: {self.database_name}.{self.collection_name}")
+            # Test the connection only for a new client (also starts filling
+            # the pool up to minPoolSize)
+            if created:
+                self.database.command('ping')
+            self.logger.info("Successfully connected to MongoDB: %s.%s", self.database_name, self.collection_name)
             
-        except Exception as e:
-            self.logger.error(f"Error connecting to MongoDB: {e}")
-            print(f"Error connecting to MongoDB: {e}")
-            raise e
+        except Exception:
+            self.logger.exception("Error connecting to MongoDB")
+            # Don't hold on to an unusable client; it's closed if nothing else uses it
+            if self.client is not None:
+                _release_client(self._client_key, self.client)
+                self.client = None
+            raise
+    
+    def _set_collection(self, collection_name):
+        """Point the dict and raw BSON collection handles at collection_name"""
+        self.collection_name = collection_name
+        self.collection = self.database.get_collection(collection_name, codec_options=_CODEC)
+        self._raw_collection = self.database.get_collection(collection_name,
+                                                            codec_options=_RAW_CODEC)
     
     def switch_collection(self, new_collection_name):
         """
@@ -78,9 +261,8 @@ class MongoDBCRUD(object):
         Args:
             new_collection_name (str): Name of the new collection
         """
-        self.collection_name = new_collection_name
-        self.collection = self.database[new_collection_name]
-        print(f"Switched to collection: {new_collection_name}")
+        self._set_collection(new_collection_name)
+        self.logger.info("Switched to collection: %s", new_collection_name)
     
     def switch_database(self, new_database_name, new_collection_name=None):
         """
@@ -93,13 +275,13 @@ class MongoDBCRUD(object):
         self.database_name = new_database_name
         self.database = self.client[new_database_name]
         
-        if new_collection_name:
-            self.collection_name = new_collection_name
-            self.collection = self.database[new_collection_name]
-        else:
-            self.collection = self.database[self.collection_name]
+        self._set_collection(new_collection_name or self.collection_name)
         
-        print(f"Switched to database: {new_database_name}.{self.collection_name}")
+        self.logger.info("Switched to database: %s.%s", new_database_name, self.collection_name)
+    
+    def _invalidate_caches(self):
+        """Drop any cached query results after a write; subclasses extend this"""
+        self._stats_cache.clear()
     
     def create(self, data):
         """
@@ -114,51 +296,316 @@ class MongoDBCRUD(object):
         try:
             if data is not None and isinstance(data, dict):
                 result = self.collection.insert_one(data)
+                self._invalidate_caches()
                 if result.inserted_id:
-                    self.logger.info(f"Document inserted with ID: {result.inserted_id}")
+                    self.logger.info("Document inserted with ID: %s", result.inserted_id)
                     return True
                 else:
                     return False
             else:
                 self.logger.warning("Invalid data provided for create operation")
-                print("Error: Data parameter must be a non-empty dictionary")
                 return False
-        except Exception as e:
-            self.logger.error(f"Error inserting document: {e}")
-            print(f"Error inserting document: {e}")
+        except Exception:
+            self.logger.exception("Error inserting document")
             return False
     
-    def read(self, query=None):
+    def create_batched(self, data):
+        """
+        Queue a document for insertion by the background batch writer
+        
+        Queued inserts are flushed with a single unordered bulk_write every
+        500 documents or 50 ms, whichever comes first.
+        
+        Args:
+           data (dict): A dictionary containing key/value pairs for the document
+           
+        Returns:
+           Future: Resolves to True once inserted, or to False for invalid data;
+                   raises the write error from result() if the insert failed.
+                   Cancelling it while still queued skips the insert.
+        """
+        future = Future()
+        if data is None or not isinstance(data, dict):
+            self.logger.warning("Invalid data provided for create_batched operation")
+            future.set_result(False)
+            return future
+        
+        with self._writer_lock:
+            if self._writer_thread is None:
+                self._writer_thread = threading.Thread(target=self._batch_writer,
+                                                       name="mongo-batch-writer", daemon=True)
+                self._writer_thread.start()
+                # The writer is a daemon thread, so flush queued inserts on exit
+                atexit.register(self._stop_batch_writer)
+            # Queue under the lock so a concurrent _stop_batch_writer can't put
+            # its stop sentinel ahead of this item
+            self._write_q.put((self.collection, data, future))
+        return future
+    
+    def _batch_writer(self, max_batch=500, max_wait=0.05):
+        """Drain the write queue and flush batches with bulk_write"""
+        while True:
+            item = self._write_q.get()
+            if item is None:
+                return
+            batch = [item]
+            deadline = time.monotonic() + max_wait
+            stop = False
+            while len(batch) < max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._write_q.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+            # Never let one bad batch end the thread; later futures would hang
+            try:
+                self._flush_batch(batch)
+            except Exception as e:
+                self.logger.exception("Unexpected error in batch writer")
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+            if stop:
+                return
+    
+    def _flush_batch(self, batch):
+        """Insert one batch of queued documents, grouped by target collection"""
+        groups = {}
+        for collection, data, future in batch:
+            # Skip inserts whose future was cancelled while queued; the rest
+            # can no longer be cancelled
+            if not future.set_running_or_notify_cancel():
+                continue
+            groups.setdefault(collection.full_name, (collection, []))[1].append((data, future))
+        
+        for collection, items in groups.values():
+            failed = {}
+            try:
+                collection.bulk_write([InsertOne(data) for data, _ in items],
+                                      ordered=False, bypass_document_validation=False)
+            except BulkWriteError as e:
+                for error in e.details.get("writeErrors", []):
+                    failed[error["index"]] = e
+                # A write concern error applies to every document that was written
+                if e.details.get("writeConcernErrors"):
+                    failed = dict.fromkeys(range(len(items)), e)
+            except Exception as e:
+                self.logger.exception("Error bulk inserting documents")
+                for _, future in items:
+                    future.set_exception(e)
+                continue
+            
+            self._invalidate_caches()
+            self.logger.info("Bulk inserted %d documents", len(items) - len(failed))
+            for index, (_, future) in enumerate(items):
+                if index in failed:
+                    future.set_exception(failed[index])
+                else:
+                    future.set_result(True)
+    
+    def _stop_batch_writer(self):
+        """Flush any queued writes and stop the background writer"""
+        with self._writer_lock:
+            if self._writer_thread is not None:
+                self._write_q.put(None)
+                self._writer_thread.join()
+                self._writer_thread = None
+                atexit.unregister(self._stop_batch_writer)
+    
+    @_validate_query(list, allow_none=True)
+    def read(self, query=None, projection=None, as_iterator=False, batch_size=None):
         """
         Query for documents from the collection
         
         Args: 
             query (dict, optional): A dictionary containing key/value lookup pairs.
                                   If None, returns all documents.
+            projection (dict, optional): Fields to include/exclude. If None, returns all fields.
+            as_iterator (bool): If True, return the cursor so results can be iterated lazily
+            batch_size (int, optional): Documents fetched per round trip (default: 500)
             
         Returns:
              list: A list of documents if successful, empty list otherwise
+                   (a Cursor instead when as_iterator is True)
         """
         try:
-            # Default to empty dict if no query provided (returns all documents)
-            if query is None:
-                query = {}
+            cursor = self.collection.find(query, projection, batch_size=batch_size or 500)
+            if as_iterator:
+                return cursor
+            result_list = list(cursor)
+            self.logger.debug("Found %d documents", len(result_list))
+            return result_list
+        except Exception:
+            self.logger.exception("Error querying documents")
+            return []
+    
+    @_validate_query(_empty_dataframe, allow_none=True)
+    def read_df(self, query=None, columns=None, batch_size=1000):
+        """
+        Query for documents straight into a pandas DataFrame
+        
+        Each column is written into a preallocated numpy array while the cursor
+        is iterated, so no intermediate list of documents is built.
+        
+        Args:
+            query (dict, optional): A dictionary containing key/value lookup pairs.
+                                  If None, returns all documents.
+            columns (dict): Field name -> numpy dtype for each column to load
+            batch_size (int): Documents fetched per round trip (default: 1000)
             
-            if isinstance(query, dict):
-                cursor = self.collection.find(query)
-                result_list = list(cursor)
-                self.logger.info(f"Found {len(result_list)} documents")
-                return result_list
-            else:
-                self.logger.warning("Invalid query provided for read operation")
-                print("Error: Query parameter must be a dictionary")
-                return []
+        Returns:
+            DataFrame: One row per matching document, empty DataFrame otherwise.
+                       Missing fields, and values that can't be converted to
+                       the column dtype, are NaN (float), NaT (datetime and
+                       timedelta), None (object) or 0 (other numeric types).
+        """
+        import numpy as np
+        import pandas as pd
+        
+        if not columns:
+            self.logger.warning("No columns provided for read_df operation")
+            return pd.DataFrame()
+        
+        try:
+            collection = self.collection
+            count = collection.count_documents(query)
+            
+            names = list(columns)
+            arrays = []
+            for name in names:
+                dtype = np.dtype(columns[name])
+                if dtype.kind == "f":
+                    arrays.append(np.full(count, np.nan, dtype=dtype))
+                elif dtype.kind in "Mm":
+                    arrays.append(np.full(count, np.datetime64("NaT") if dtype.kind == "M"
+                                          else np.timedelta64("NaT"), dtype=dtype))
+                elif dtype.kind == "O":
+                    arrays.append(np.empty(count, dtype=dtype))
+                else:
+                    arrays.append(np.zeros(count, dtype=dtype))
+            
+            projection = dict.fromkeys(names, 1)
+            projection.setdefault("_id", 0)
+            
+            # Limit to the counted size in case documents were inserted meanwhile
+            # (a limit of 0 means no limit, so skip the query when nothing matched)
+            filled = 0
+            skipped = dict.fromkeys(names, 0)
+            if count:
+                cursor = collection.find(query, projection, batch_size=batch_size, limit=count)
+                for i, doc in enumerate(cursor):
+                    for name, array in zip(names, arrays):
+                        value = doc.get(name)
+                        if value is not None:
+                            try:
+                                array[i] = value
+                            except (TypeError, ValueError, OverflowError):
+                                skipped[name] += 1
+                    filled = i + 1
+            
+            for name, bad in skipped.items():
+                if bad:
+                    self.logger.warning("Skipped %d values in column %s that don't fit dtype %s",
+                                        bad, name, np.dtype(columns[name]))
+            
+            # Documents may also have been deleted since the count
+            if filled < count:
+                arrays = [array[:filled] for array in arrays]
+            
+            self.logger.debug("Loaded %d documents into DataFrame", filled)
+            return pd.DataFrame(dict(zip(names, arrays)), copy=False)
+        except Exception:
+            self.logger.exception("Error querying documents")
+            return pd.DataFrame()
+    
+    @_validate_query(list, allow_none=True)
+    def read_raw(self, query=None, projection=None, batch_size=None):
+        """
+        Query for documents without decoding them into dicts
+        
+        Args: 
+            query (dict, optional): A dictionary containing key/value lookup pairs.
+                                  If None, returns all documents.
+            projection (dict, optional): Fields to include/exclude. If None, returns all fields.
+            batch_size (int, optional): Documents fetched per round trip (default: 500)
+            
+        Returns:
+             list: RawBSONDocuments (BSON bytes available as .raw), empty list on error
+        """
+        try:
+            result_list = list(self._raw_collection.find(query, projection, batch_size=batch_size or 500))
+            self.logger.debug("Found %d documents", len(result_list))
+            return result_list
+        except Exception:
+            self.logger.exception("Error querying documents")
+            return []
+    
+    def _get_async_collection(self):
+        """Return the current collection through the Motor client for the running loop"""
+        from motor.motor_asyncio import AsyncIOMotorClient
+        
+        loop = asyncio.get_running_loop()
+        with self._async_clients_lock:
+            client = self._async_clients.get(loop)
+            if client is None:
+                # Drop clients whose loop has finished (e.g. earlier asyncio.run calls)
+                for old_loop in [l for l in self._async_clients if l.is_closed()]:
+                    self._close_async_client(self._async_clients.pop(old_loop))
+                # Keep Motor's pool the same size as the sync pool; MOTOR_MAX_WORKERS
+                # should not be raised above it or the worker threads contend for sockets
+                client = AsyncIOMotorClient(self._connection_string,
+                                            maxPoolSize=self.max_pool_size)
+                self._async_clients[loop] = client
+        return client[self.database_name].get_collection(self.collection_name,
+                                                         codec_options=_CODEC)
+    
+    def _close_async_client(self, client):
+        """Close a Motor client, ignoring errors from an already closed event loop"""
+        try:
+            client.close()
         except Exception as e:
-            self.logger.error(f"Error querying documents: {e}")
-            print(f"Error querying documents: {e}")
+            self.logger.debug("Error closing Motor client: %s", e)
+    
+    @_validate_query(list, allow_none=True)
+    async def aread(self, query=None, projection=None):
+        """
+        Asynchronously query for documents from the collection
+        
+        Lets callers run several queries concurrently, e.g. with asyncio.gather()
+        
+        Args: 
+            query (dict, optional): A dictionary containing key/value lookup pairs.
+                                  If None, returns all documents.
+            projection (dict, optional): Fields to include/exclude. If None, returns all fields.
+            
+        Returns:
+             list: A list of documents if successful, empty list otherwise
+        """
+        # Outside the try so a missing motor package raises instead of returning []
+        collection = self._get_async_collection()
+        try:
+            cursor = collection.find(query, projection)
+            result_list = await cursor.to_list(length=None)
+            self.logger.debug("Found %d documents", len(result_list))
+            return result_list
+        except Exception:
+            self.logger.exception("Error querying documents")
             return []
     
-    def update(self, query, update_data, update_many=True):
+    def _write_collection(self, write_concern):
+        """Return the collection to write through, unacknowledged if write_concern is 0"""
+        if write_concern == 0:
+            return self.collection.with_options(write_concern=WriteConcern(w=0))
+        return self.collection
+    
+    @_validate_query(int)
+    def update(self, query, update_data, update_many=True, write_concern=None):
         """
         Update document(s) in the collection
         
@@ -166,61 +613,69 @@ class MongoDBCRUD(object):
             query (dict): A dictionary containing key/value pairs to find documents
             update_data (dict): A dictionary containing the update operations
             update_many (bool): If True, update all matching documents. If False, update only the first match.
+            write_concern (int, optional): Pass 0 for a fire-and-forget (w=0) write
+                                           that does not wait for the server
             
         Returns:
             int: Number of documents modified, 0 if no documents were modified
+                 (always 0 when write_concern is 0)
         """
         try:
-            if query is not None and isinstance(query, dict) and \
-               update_data is not None and isinstance(update_data, dict):
+            if type(update_data) is dict or isinstance(update_data, dict):
+                collection = self._write_collection(write_concern)
                 
                 # Choose update method based on update_many parameter
                 if update_many:
-                    result = self.collection.update_many(query, {"$set": update_data})
+                    result = collection.update_many(query, {"$set": update_data})
                 else:
-                    result = self.collection.update_one(query, {"$set": update_data})
+                    result = collection.update_one(query, {"$set": update_data})
+                self._invalidate_caches()
                 
-                self.logger.info(f"Updated {result.modified_count} documents")
+                if not result.acknowledged:
+                    return 0
+                self.logger.info("Updated %d documents", result.modified_count)
                 return result.modified_count
             else:
-                self.logger.warning("Invalid parameters provided for update operation")
-                print("Error: Both query and update_data parameters must be dictionaries")
+                self.logger.warning("Invalid update_data provided for update operation")
                 return 0
-        except Exception as e:
-            self.logger.error(f"Error updating documents: {e}")
-            print(f"Error updating documents: {e}")
+        except Exception:
+            self.logger.exception("Error updating documents")
             return 0
     
-    def delete(self, query, delete_many=True):
+    @_validate_query(int)
+    def delete(self, query, delete_many=True, write_concern=None):
         """
         Delete document(s) from the collection
         
         Args:
             query (dict): A dictionary containing key/value pairs to find documents to delete
             delete_many (bool): If True, delete all matching documents. If False, delete only the first match.
+            write_concern (int, optional): Pass 0 for a fire-and-forget (w=0) write
+                                           that does not wait for the server
             
         Returns:
             int: Number of documents deleted, 0 if no documents were deleted
+                 (always 0 when write_concern is 0)
         """
         try:
-            if query is not None and isinstance(query, dict):
-                # Choose delete method based on delete_many parameter
-                if delete_many:
-                    result = self.collection.delete_many(query)
-                else:
-                    result = self.collection.delete_one(query)
-                
-                self.logger.info(f"Deleted {result.deleted_count} documents")
-                return result.deleted_count
+            collection = self._write_collection(write_concern)
+            
+            # Choose delete method based on delete_many parameter
+            if delete_many:
+                result = collection.delete_many(query)
             else:
-                self.logger.warning("Invalid query provided for delete operation")
-                print("Error: Query parameter must be a dictionary")
+                result = collection.delete_one(query)
+            self._invalidate_caches()
+            
+            if not result.acknowledged:
                 return 0
-        except Exception as e:
-            self.logger.error(f"Error deleting documents: {e}")
-            print(f"Error deleting documents: {e}")
+            self.logger.info("Deleted %d documents", result.deleted_count)
+            return result.deleted_count
+        except Exception:
+            self.logger.exception("Error deleting documents")
             return 0
     
+    @_validate_query(int, allow_none=True)
     def count_documents(self, query=None):
         """
         Count documents in the collection
@@ -229,41 +684,53 @@ class MongoDBCRUD(object):
             query (dict, optional): Filter criteria. If None, counts all documents.
             
         Returns:
-            int: Number of documents matching the query
+            int: Number of documents matching the query. Without a filter this
+                 comes from collection metadata, which can be slightly off after
+                 an unclean shutdown or while orphaned documents exist on a
+                 sharded cluster.
         """
         try:
-            if query is None:
-                query = {}
-            
-            if isinstance(query, dict):
-                count = self.collection.count_documents(query)
-                return count
-            else:
-                print("Error: Query parameter must be a dictionary")
-                return 0
-        except Exception as e:
-            self.logger.error(f"Error counting documents: {e}")
-            print(f"Error counting documents: {e}")
+            if not query:
+                return self.collection.estimated_document_count()
+            return self.collection.count_documents(query)
+        except Exception:
+            self.logger.exception("Error counting documents")
             return 0
     
     def close_connection(self):
-        """Close the MongoDB connection"""
+        """Release this instance's MongoDB connection (closed when no other instance shares it)"""
         try:
+            self._stop_batch_writer()
             if self.client:
-                self.client.close()
-                self.logger.info("MongoDB connection closed")
-                print("MongoDB connection closed successfully")
-        except Exception as e:
-            self.logger.error(f"Error closing connection: {e}")
-            print(f"Error closing connection: {e}")
+                # The client is shared, so it is only closed once the last
+                # instance using it lets go
+                if _release_client(self._client_key, self.client):
+                    self.logger.info("MongoDB connection closed")
+                self.client = None
+            with self._async_clients_lock:
+                async_clients = list(self._async_clients.values())
+                self._async_clients.clear()
+            for async_client in async_clients:
+                self._close_async_client(async_client)
+        except Exception:
+            self.logger.exception("Error closing connection")
     
-    def get_collection_info(self):
+    def get_collection_info(self, max_age=5):
         """
         Get information about the current collection
         
+        Args:
+            max_age (float): Seconds a cached result is reused before collStats runs again
+        
         Returns:
             dict: Collection statistics and information
         """
+        cache_key = (self.database_name, self.collection_name)
+        cached = self._stats_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < max_age:
+            # Copy so callers can't modify the cached stats
+            return dict(cached[1])
+        
         try:
             stats = self.database.command("collStats", self.collection_name)
             info = {
@@ -273,12 +740,27 @@ class MongoDBCRUD(object):
                 "size_bytes": stats.get("size", 0),
                 "avg_document_size": stats.get("avgObjSize", 0)
             }
-            return info
-        except Exception as e:
-            self.logger.error(f"Error getting collection info: {e}")
+            self._stats_cache[cache_key] = (time.monotonic(), info)
+            return dict(info)
+        except Exception:
+            self.logger.exception("Error getting collection info")
             return {}
 
 
+# Dog breeds suited to each rescue training type
+_RESCUE_BREEDS = {
+    "water": ("Labrador Retriever Mix", "Chesapeake Bay Retriever",
+              "Newfoundland", "Portuguese Water Dog"),
+    "mountain": ("German Shepherd", "Alaskan Malamute", "Old English Sheepdog",
+                 "Siberian Husky", "Rottweiler"),
+    "disaster": ("Doberman Pinscher", "German Shepherd", "Golden Retriever",
+                 "Bloodhound", "Rottweiler")
+}
+
+# Every breed that qualifies for at least one rescue type
+_ALL_RESCUE_BREEDS = tuple(sorted({breed for breeds in _RESCUE_BREEDS.values() for breed in breeds}))
+
+
 # Convenience class for Animal Shelter specific operations
 class AnimalShelter(MongoDBCRUD):
     """
@@ -286,8 +768,42 @@ class AnimalShelter(MongoDBCRUD):
     Inherits from the generic MongoDBCRUD class
     """
     
+    # Fields returned for rescue candidates (what the dashboard table and map use)
+    RESCUE_PROJECTION = {
+        "animal_id": 1,
+        "name": 1,
+        "breed": 1,
+        "age_upon_outcome_in_weeks": 1,
+        "sex_upon_outcome": 1,
+        "animal_type": 1,
+        "location_lat": 1,
+        "location_long": 1,
+        "_id": 0
+    }
+    
+    # Query for each rescue training type, built once at import
+    _RESCUE_CRITERIA = {
+        "water": {
+            "animal_type": "Dog",
+            "breed": {"$in": _RESCUE_BREEDS["water"]},
+            "age_upon_outcome_in_weeks": {"$gte": 26, "$lte": 156}
+        },
+        "mountain": {
+            "animal_type": "Dog",
+            "breed": {"$in": _RESCUE_BREEDS["mountain"]},
+            "age_upon_outcome_in_weeks": {"$gte": 26, "$lte": 156}
+        },
+        "disaster": {
+            "animal_type": "Dog",
+            "breed": {"$in": _RESCUE_BREEDS["disaster"]},
+            "age_upon_outcome_in_weeks": {"$gte": 20, "$lte": 300}
+        }
+    }
+    
     def __init__(self, username="aacuser", password="SNHU1234", 
-                 host=None, port=None, database_name="AAC", collection_name="animals"):
+                 host=None, port=None, database_name="AAC", collection_name="animals",
+                 ensure_indexes=True, max_pool_size=None, min_pool_size=None,
+                 wait_queue_timeout_ms=None):
         """
         Initialize Animal Shelter CRUD with default values for AAC database
         
@@ -298,57 +814,130 @@ class AnimalShelter(MongoDBCRUD):
             port (int): MongoDB port (default: from environment or 27017)
             database_name (str): Database name (default: "AAC")
             collection_name (str): Collection name (default: "animals")
+            ensure_indexes (bool): Create the rescue query index if missing (default: True)
+            max_pool_size (int): Maximum pooled sockets per server (default: 50)
+            min_pool_size (int): Sockets kept open in the pool (default: 5)
+            wait_queue_timeout_ms (int): Max wait for a free socket in ms (default: 2000)
         """
-        super().__init__(username, password, host, port, database_name, collection_name)
+        super().__init__(username, password, host, port, database_name, collection_name,
+                         max_pool_size=max_pool_size, min_pool_size=min_pool_size,
+                         wait_queue_timeout_ms=wait_queue_timeout_ms)
+        
+        # Recent rescue query results keyed by (database, collection, rescue_type)
+        self._rescue_cache = TTLCache(maxsize=16, ttl=60)
+        self._rescue_cache_lock = threading.Lock()
+        # Bumped on every invalidation so a query that overlapped a write
+        # doesn't store its stale result
+        self._rescue_cache_generation = 0
+        
+        if ensure_indexes:
+            self.ensure_indexes()
+    
+    def ensure_indexes(self):
+        """Create the index used by the rescue queries, once per collection per process"""
+        ensured_key = (self._client_key, self.database_name, self.collection_name)
+        with _CLIENT_CACHE_LOCK:
+            if ensured_key in _ENSURED_INDEXES:
+                return
+        try:
+            self.collection.create_index([("animal_type", 1), ("breed", 1),
+                                          ("age_upon_outcome_in_weeks", 1)],
+                                         background=True, name="rescue_idx")
+        except Exception as e:
+            self.logger.warning("Error creating rescue index: %s", e)
+            return
+        with _CLIENT_CACHE_LOCK:
+            _ENSURED_INDEXES.add(ensured_key)
+    
+    def _invalidate_caches(self):
+        """Drop cached rescue results after a write"""
+        super()._invalidate_caches()
+        with self._rescue_cache_lock:
+            self._rescue_cache.clear()
+            self._rescue_cache_generation += 1
     
-    def find_rescue_candidates(self, rescue_type="water"):
+    def find_rescue_candidates(self, rescue_type="water", projection=None):
         """
         Find animals suitable for specific rescue training
         
         Args:
             rescue_type (str): Type of rescue training ("water", "mountain", "disaster")
+            projection (dict, optional): Fields to return (default: RESCUE_PROJECTION)
+            
+        Returns:
+            list: List of suitable animals (default-projection results are cached for
+                  60 seconds; each call gets its own copies of the cached documents)
+        """
+        query = self._RESCUE_CRITERIA.get(rescue_type)
+        if query is None:
+            self.logger.warning("Unknown rescue type: %s", rescue_type)
+            return []
+        
+        if projection is not None:
+            return self.read(query, projection)
+        
+        # Only results for the default projection are cached
+        cache_key = (self.database_name, self.collection_name, rescue_type)
+        with self._rescue_cache_lock:
+            cached = self._rescue_cache.get(cache_key)
+            generation = self._rescue_cache_generation
+        if cached is None:
+            # Query directly rather than through read() so a failed query
+            # is not cached as an empty result
+            try:
+                cached = list(self.collection.find(query, self.RESCUE_PROJECTION, batch_size=500))
+            except Exception:
+                self.logger.exception("Error querying documents")
+                return []
+            with self._rescue_cache_lock:
+                if self._rescue_cache_generation == generation:
+                    self._rescue_cache[cache_key] = cached
+        # Copy so callers can't modify the cached documents
+        return [dict(doc) for doc in cached]
+    
+    async def afind_rescue_candidates(self, rescue_type="water", projection=None):
+        """
+        Asynchronously find animals suitable for specific rescue training
+        
+        Args:
+            rescue_type (str): Type of rescue training ("water", "mountain", "disaster")
+            projection (dict, optional): Fields to return (default: RESCUE_PROJECTION)
             
         Returns:
             list: List of suitable animals
         """
-        rescue_criteria = {
-            "water": {
-                "animal_type": "Dog",
-                "breed": {"$in": ["Labrador Retriever Mix", "Chesapeake Bay Retriever", 
-                                "Newfoundland", "Portuguese Water Dog"]},
-                "$expr": {
-                    "$and": [
-                        {"$gte": ["$age_upon_outcome_in_weeks", 26]},
-                        {"$lte": ["$age_upon_outcome_in_weeks", 156]}
-                    ]
-                }
-            },
-            "mountain": {
-                "animal_type": "Dog", 
-                "breed": {"$in": ["German Shepherd", "Alaskan Malamute", "Old English Sheepdog",
-                                "Siberian Husky", "Rottweiler"]},
-                "$expr": {
-                    "$and": [
-                        {"$gte": ["$age_upon_outcome_in_weeks", 26]},
-                        {"$lte": ["$age_upon_outcome_in_weeks", 156]}
-                    ]
-                }
-            },
-            "disaster": {
-                "animal_type": "Dog",
-                "breed": {"$in": ["Doberman Pinscher", "German Shepherd", "Golden Retriever",
-                                "Bloodhound", "Rottweiler"]},
-                "$expr": {
-                    "$and": [
-                        {"$gte": ["$age_upon_outcome_in_weeks", 20]},
-                        {"$lte": ["$age_upon_outcome_in_weeks", 300]}
-                    ]
-                }
-            }
-        }
+        query = self._RESCUE_CRITERIA.get(rescue_type)
+        if query is None:
+            self.logger.warning("Unknown rescue type: %s", rescue_type)
+            return []
+        return await self.aread(query, projection or self.RESCUE_PROJECTION)
+    
+    def get_all_rescue_summaries(self, limit=500):
+        """
+        Find candidates for every rescue type in a single aggregation round trip
         
-        if rescue_type in rescue_criteria:
-            return self.read(rescue_criteria[rescue_type])
-        else:
-            print(f"Unknown rescue type: {rescue_type}")
-            return []
\ No newline at end of file
+        Args:
+            limit (int): Maximum animals returned per rescue type (default: 500)
+            
+        Returns:
+            dict: Rescue type -> list of suitable animals, empty dict on error
+        """
+        # $facet sub-pipelines can't use indexes, so narrow to the rescue
+        # breeds first with a $match that can use rescue_idx
+        pipeline = [
+            {"$match": {"animal_type": "Dog", "breed": {"$in": _ALL_RESCUE_BREEDS}}},
+            {"$facet": {
+                rescue_type: [
+                    {"$match": criteria},
+                    {"$project": self.RESCUE_PROJECTION},
+                    {"$limit": limit}
+                ]
+                for rescue_type, criteria in self._RESCUE_CRITERIA.items()
+            }}
+        ]
+        try:
+            results = list(self.collection.aggregate(pipeline))
+            return results[0] if results else {}
+        except Exception:
+            self.logger.exception("Error aggregating rescue summaries")
+            return {}
\ No newline at end of file